@@ -1,17 +1,30 @@
 # -*- coding: utf-8 -*-
 
+import sys
+
 from .types import (
     JavaBuiltInTypes,
+    JavaObjectType,
     JavaTypeError,
-    NoSuchJavaMethod,
 )
 
+
 class JavaExpression(object):
     """AST for simple Java expressions.
 
     Note that this library deals only with compile-time types, and this class therefore does not
     actually *evaluate* expressions.
+
+    The only costly part of finding a static type is resolving a method call, so JavaMethodCall
+    caches its resolution; other nodes' static types are plain attribute reads.
     """
+    __slots__ = ('_checked_by', '_checked_generation')
+
+    def __init__(self):
+        # The last JavaTypeChecker this node passed, and the JavaObjectType._method_generation
+        # it passed in
+        self._checked_by = None
+        self._checked_generation = None
 
     def static_type(self):
         """Returns the compile-time type of this expression as a JavaType.
@@ -26,10 +39,15 @@ class JavaExpression(object):
         Raises a JavaTypeError if there is an error. If there is no error, this method has no effect
         and returns nothing.
 
-        Subclasses must override this method.
+        The checking itself lives in JavaTypeChecker; this uses a shared default checker.
         """
-        raise NotImplementedError(type(self).__name__ + " must override check_types()")
-    
+        _DEFAULT_CHECKER.check(self)
+
+    def assignment_target_description(self):
+        """Describes this expression as the target of an assignment, for error messages.
+        """
+        return self.static_type().name
+
 
 class JavaVariable(JavaExpression):
     """An expression that reads the value of a variable, e.g. `x` in the expression `x + 5`.
@@ -38,39 +56,42 @@ class JavaVariable(JavaExpression):
     after the initial construction of the AST. In this sample project, however, we simply specify
     the declared_type for every variable reference.
     """
+    __slots__ = ('name', 'declared_type')
+
     def __init__(self, name, declared_type):
+        super().__init__()
         self.name = name
         self.declared_type = declared_type
 
     def static_type(self):
         return self.declared_type
-    
-    def check_types(self):
-        pass  # variables do not have type errors on their own 
+
+    def assignment_target_description(self):
+        return f"variable {self.name} of type {self.declared_type.name}"
+
 
 class JavaLiteral(JavaExpression):
     """A literal value entered in the code, e.g. `5` in the expression `x + 5`.
     """
+    __slots__ = ('value', 'type')
+
     def __init__(self, value, type):
+        super().__init__()
         self.value = value  #: The literal value, as a string
         self.type = type    #: The type of the literal (JavaType)
 
     def static_type(self):
         return self.type
 
-    def check_types(self):
-        pass  # just a literal, no type errors
-
 
 class JavaNullLiteral(JavaLiteral):
     """The literal value `null` in Java code.
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("null", JavaBuiltInTypes.NULL)
 
-    def static_type(self):
-        return self.type  
-
 
 class JavaAssignment(JavaExpression):
     """The assignment of a new value to a variable.
@@ -79,41 +100,16 @@ class JavaAssignment(JavaExpression):
         lhs (JavaVariable): The variable whose value this assignment updates.
         rhs (JavaExpression): The expression whose value will be assigned to the lhs.
     """
+    __slots__ = ('lhs', 'rhs')
+
     def __init__(self, lhs, rhs):
+        super().__init__()
         self.lhs = lhs
         self.rhs = rhs
 
     def static_type(self):
         return self.lhs.static_type()
-    
-
-    def check_types(self):
-        # first, check types of lhs and rhs expressions
-        self.lhs.check_types()
-        self.rhs.check_types()
-
-        # get the static types of lhs and rhs
-        lhs_type = self.lhs.static_type()
-        rhs_type = self.rhs.static_type()
 
-        # check if RHS type is a subtype of LHS type
-        if not rhs_type.is_subtype_of(lhs_type):
-            # prepare error message
-            lhs_type_name = lhs_type.name
-            rhs_type_name = rhs_type.name
-
-            # get the variable name from lhs if it's a JavaVariable
-            if isinstance(self.lhs, JavaVariable):
-                variable_name = self.lhs.name
-                error_message = f"Cannot assign {rhs_type_name} to variable {variable_name} of type {lhs_type_name}"
-            else:
-                # if lhs is not a variable, use a generic message
-                error_message = f"Cannot assign {rhs_type_name} to {lhs_type_name}"
-
-            # raise a JavaTypeMismatchError
-            raise JavaTypeMismatchError(error_message)
-
-        
 
 class JavaMethodCall(JavaExpression):
     """A Java method invocation.
@@ -124,85 +120,45 @@ class JavaMethodCall(JavaExpression):
 
     - The receiver is `JavaVariable(foo, JavaObjectType(...))`
     - The method_name is `"bar"`
-    - The args are `[JavaLiteral("0", JavaBuiltInTypes.INT), ...etc...]`
+    - The args are `(JavaLiteral("0", JavaBuiltInTypes.INT), ...etc...)`
 
     Attributes:
         receiver (JavaExpression): The object whose method we are calling
         method_name (String): The name of the method to call
-        args (list of Expressions): The arguments to pass to the method
+        args (tuple of Expressions): The arguments to pass to the method
     """
+    __slots__ = ('receiver', 'method_name', 'args', '_resolved', '_resolved_version')
+
     def __init__(self, receiver, method_name, *args):
+        super().__init__()
         self.receiver = receiver
-        self.method_name = method_name
+        self.method_name = sys.intern(method_name)
         self.args = args
+        self._resolved = None
+        self._resolved_version = None
 
-    def static_type(self):
-        # Get the static type of the receiver
-        receiver_type = self.receiver.static_type()
-
-        # Ensure the receiver is an object type
-        if not receiver_type.is_object_type:
-            raise JavaTypeError(
-                f"Cannot call method {self.method_name} on primitive type {receiver_type.name}"
-            )
-
-        # Find the method in the receiver's type
-        try:
-            method = receiver_type.method_named(self.method_name)
-        except NoSuchJavaMethod as e:
-            raise JavaTypeError(str(e))
+    def _resolve(self):
+        """Returns the receiver's static type and the JavaMethod this call invokes, as a tuple.
 
-        # Return the method's return type
-        return method.return_type
-
-    def check_types(self):
-        # First, check the receiver expression
-        self.receiver.check_types()
+        Both static_type() and the type checker need these, so the lookup is cached. The cache holds
+        until the receiver type, or one of its supertypes, gains a method.
+        """
         receiver_type = self.receiver.static_type()
+        resolved = self._resolved
+        if (resolved is None
+                or resolved[0] is not receiver_type
+                or self._resolved_version != receiver_type._methods_version):
+            # No need to test is_object_type first: types without methods raise NoSuchJavaMethod
+            # from method_named() themselves.
+            resolved = (receiver_type, receiver_type.method_named(self.method_name))
+            self._resolved = resolved
+            self._resolved_version = receiver_type._methods_version
+        return resolved
 
-        # Ensure the receiver is an object type
-        if not receiver_type.is_object_type:
-            raise NoSuchJavaMethod(f"Type {receiver_type.name} does not have methods")
-
-        # Try to find the method in the receiver's type
-        try:
-            method = receiver_type.method_named(self.method_name)
-        except NoSuchJavaMethod as e:
-            # Re-raise the exception to preserve the specific message
-            raise NoSuchJavaMethod(str(e))
-
-        # Check the number of arguments
-        expected_arg_count = len(method.parameter_types)
-        actual_arg_count = len(self.args)
-
-        if expected_arg_count != actual_arg_count:
-            raise JavaArgumentCountError(
-                f"Wrong number of arguments for {receiver_type.name}.{self.method_name}(): "
-                f"expected {expected_arg_count}, got {actual_arg_count}"
-            )
-
-        # Check each argument's type
-        for arg_expr, param_type in zip(self.args, method.parameter_types):
-            arg_expr.check_types()
-            arg_type = arg_expr.static_type()
-
-            if not arg_type.is_subtype_of(param_type):
-                expected_types = [ptype.name for ptype in method.parameter_types]
-                actual_types = [arg.static_type().name for arg in self.args]
-                raise JavaTypeMismatchError(
-                    f"{receiver_type.name}.{self.method_name}() expects arguments of type "
-                    f"({', '.join(expected_types)}), but got "
-                    f"({', '.join(actual_types)})"
-                )
-
-
+    def static_type(self):
+        return self._resolve()[1].return_type
 
-# Helper method for formatting lists
-def _comma_separated_list(items):
-    return ", ".join(items)
 
-    
-    
 class JavaConstructorCall(JavaExpression):
     """
     A Java object instantiation
@@ -212,27 +168,201 @@ class JavaConstructorCall(JavaExpression):
         new Foo(0, 1, 2)
 
     - The instantiated_type is `JavaObjectType("Foo", ...)`
-    - The args are `[JavaLiteral("0", JavaBuiltInTypes.INT), ...etc...]`
+    - The args are `(JavaLiteral("0", JavaBuiltInTypes.INT), ...etc...)`
 
     Attributes:
         instantiated_type (JavaType): The type to instantiate
-        args (list of Expressions): Constructor arguments
+        args (tuple of Expressions): Constructor arguments
     """
+    __slots__ = ('instantiated_type', 'args')
+
     def __init__(self, instantiated_type, *args):
+        super().__init__()
         self.instantiated_type = instantiated_type
         self.args = args
 
 
+class JavaTypeChecker(object):
+    """Checks expressions for static type errors.
+
+    The checker finds the rule for each node through a dict keyed by the node's class, rather than
+    through a check_types() override on every expression class. One checker can be reused across
+    any number of check() calls; JavaExpression.check_types() uses a shared default instance.
+
+    Each node records the last checker it passed, so checking it again with that same checker is
+    skipped until some type's methods change.
+    """
+
+    def __init__(self):
+        # Bind handlers by name so that subclasses can override any of them
+        self._dispatch = {
+            expr_class: getattr(self, handler_name)
+            for expr_class, handler_name in self._HANDLERS.items()
+        }
+
+    def check(self, expr):
+        """Raises a JavaTypeError if the given expression or any of its subexpressions has a static
+        type error. Otherwise, does nothing and returns nothing.
+        """
+        generation = JavaObjectType._method_generation
+        if expr._checked_by is self and expr._checked_generation == generation:
+            return
+        handler = self._dispatch.get(type(expr))
+        if handler is None:
+            handler = self._find_handler(type(expr))
+        handler(expr)
+        # Not reached if the handler raised, so failures recheck
+        expr._checked_by = self
+        expr._checked_generation = generation
+
+    def _find_handler(self, expr_class):
+        # Subclasses of the known node classes (e.g. JavaNullLiteral) share their parent's rule
+        for cls in expr_class.__mro__:
+            handler = self._dispatch.get(cls)
+            if handler is not None:
+                self._dispatch[expr_class] = handler
+                return handler
+        # A node class with no rule here may still know how to check itself
+        if expr_class.check_types is not JavaExpression.check_types:
+            handler = self._dispatch[expr_class] = self._check_own
+            return handler
+        raise NotImplementedError(
+            expr_class.__name__ + " is not supported by " + type(self).__name__)
+
+    def _check_own(self, expr):
+        expr.check_types()
+
+    def _check_leaf(self, expr):
+        pass  # variables and literals do not have type errors on their own
+
+    def _check_assignment(self, expr):
+        # first, check types of lhs and rhs expressions
+        self.check(expr.lhs)
+        self.check(expr.rhs)
+
+        # get the static types of lhs and rhs
+        lhs_type = expr.lhs.static_type()
+        rhs_type = expr.rhs.static_type()
+
+        # check if RHS type is a subtype of LHS type
+        if not rhs_type.is_subtype_of(lhs_type):
+            raise JavaTypeMismatchError(
+                f"Cannot assign {rhs_type.name} to {expr.lhs.assignment_target_description()}")
+
+    def _check_method_call(self, expr):
+        # First, check the receiver expression
+        self.check(expr.receiver)
+        receiver_type, method = expr._resolve()
+
+        # Check the number of arguments
+        expected_arg_count = len(method.parameter_types)
+        actual_arg_count = len(expr.args)
+
+        if expected_arg_count != actual_arg_count:
+            raise JavaArgumentCountError(
+                callee_type=receiver_type,
+                callee_name=expr.method_name,
+                expected_count=expected_arg_count,
+                actual_count=actual_arg_count)
+
+        # Check the arguments themselves before checking that they fit the method
+        for arg_expr in expr.args:
+            self.check(arg_expr)
+        arg_types = [arg_expr.static_type() for arg_expr in expr.args]
+
+        # Check each argument's type, collecting all bad arguments rather than stopping at the first
+        mismatches = [
+            (index, arg_type, param_type)
+            for index, (arg_type, param_type) in enumerate(zip(arg_types, method.parameter_types))
+            if not arg_type.is_subtype_of(param_type)
+        ]
+        if mismatches:
+            raise JavaTypeMismatchError(
+                callee_type=receiver_type,
+                callee_name=expr.method_name,
+                expected_types=method.parameter_types,
+                actual_types=arg_types,
+                mismatches=mismatches)
+
+    _HANDLERS = {
+        JavaVariable: "_check_leaf",
+        JavaLiteral: "_check_leaf",
+        JavaAssignment: "_check_assignment",
+        JavaMethodCall: "_check_method_call",
+    }
+
+
+_DEFAULT_CHECKER = JavaTypeChecker()
+
+
 class JavaTypeMismatchError(JavaTypeError):
     """Indicates that one or more expressions do not evaluate to the correct type.
+
+    Either pass a ready-made message, or describe a bad call by its callee and the expected and
+    actual argument types. In the latter case, the message is only formatted if someone asks for it.
+
+    Attributes:
+        callee_type (JavaType): Type whose method was called, or None if given a message
+        callee_name (str): Name of the called method
+        expected_types (tuple of JavaType): Declared parameter types of the callee
+        actual_types (list of JavaType): Static types of the arguments actually passed
+        mismatches (list of tuple): An (index, actual type, expected type) triple for each argument
+            that does not fit its parameter
     """
-    pass
+    def __init__(self, message=None, callee_type=None, callee_name=None,
+                 expected_types=(), actual_types=(), mismatches=()):
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self.callee_type = callee_type
+        self.callee_name = callee_name
+        self.expected_types = expected_types
+        self.actual_types = actual_types
+        self.mismatches = mismatches
+
+    def __str__(self):
+        if self.callee_type is None:
+            return super().__str__()
+        return "{0} expects arguments of type {1}, but got {2}".format(
+            _describe_callee(self.callee_type, self.callee_name),
+            _names(self.expected_types),
+            _names(self.actual_types))
+
+    def __repr__(self):
+        if self.callee_type is None:
+            return super().__repr__()
+        return "{0}({1!r})".format(type(self).__name__, str(self))
 
 
 class JavaArgumentCountError(JavaTypeError):
     """Indicates that a call to a method or constructor has the wrong number of arguments.
+
+    Like JavaTypeMismatchError, accepts either a message or the raw details of the bad call.
     """
-    pass
+    def __init__(self, message=None, callee_type=None, callee_name=None,
+                 expected_count=None, actual_count=None):
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self.callee_type = callee_type
+        self.callee_name = callee_name
+        self.expected_count = expected_count
+        self.actual_count = actual_count
+
+    def __str__(self):
+        if self.callee_type is None:
+            return super().__str__()
+        return "Wrong number of arguments for {0}: expected {1}, got {2}".format(
+            _describe_callee(self.callee_type, self.callee_name),
+            self.expected_count,
+            self.actual_count)
+
+    def __repr__(self):
+        if self.callee_type is None:
+            return super().__repr__()
+        return "{0}({1!r})".format(type(self).__name__, str(self))
 
 
 class JavaIllegalInstantiationError(JavaTypeError):
@@ -244,4 +374,13 @@ class JavaIllegalInstantiationError(JavaTypeError):
 def _names(named_things):
     """Helper for formatting pretty error messages
     """
+    if not named_things:
+        return "()"
+    # str.join() builds a list from a generator anyway, so a list comprehension is faster here
     return "(" + ", ".join([e.name for e in named_things]) + ")"
+
+
+def _describe_callee(callee_type, callee_name):
+    """Helper for error messages: `Foo.bar()`
+    """
+    return "{0}.{1}()".format(callee_type.name, callee_name)
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import sys
+import weakref
+
+
 class JavaTypeError(Exception):
-    """Base class for Java type errors."""
+    """Indicates a compile-time type error in an expression.
+    """
     pass
 
 class NoSuchJavaMethod(JavaTypeError):
@@ -15,12 +20,13 @@ class JavaType(object):
     Attributes:
         name (str): Name of this type. **Note:** Names are not necessarily unique.
     """
+    __slots__ = ('name',)
 
     is_object_type = False   #: Indicates whether members of this type are objects (bool)
     is_instantiable = False  #: Indicates whether `new` can create instances of this type (bool)
 
     def __init__(self, name):
-        self.name = name
+        self.name = sys.intern(name)
 
     def is_subtype_of(self, other):
         """Returns True if and only if a value of this type can be used in a context that expects
@@ -35,6 +41,16 @@ class JavaType(object):
         """
         return other.is_subtype_of(self)
 
+    def is_subtype_of_name(self, name):
+        """Returns True if this type is a subtype of some type with the given name.
+
+        Type names are not necessarily unique, so prefer is_subtype_of() when you have the type
+        itself; this is for callers that only have names, e.g. from serialized type information.
+
+        By default a type is a subtype only of itself; subclasses with supertypes override this.
+        """
+        return name == self.name
+
     def method_named(self, method_name):
         """Returns the JavaMethod with the given name, which may come from a supertype.
 
@@ -58,10 +74,12 @@ class JavaConstructor(object):
         new Foo(34)              // This is a JavaConstructorCall
 
     Attributes:
-        parameter_types (list of JavaType): Declared parameter types
+        parameter_types (tuple of JavaType): Declared parameter types
     """
-    def __init__(self, parameter_types=[]):
-        self.parameter_types = parameter_types
+    __slots__ = ('parameter_types',)
+
+    def __init__(self, parameter_types=None):
+        self.parameter_types = tuple(parameter_types) if parameter_types else ()
 
 
 
@@ -83,12 +101,14 @@ class JavaMethod(object):
 
     Attributes:
         name (str): Name of this method
-        parameter_types (list of JavaType): Declared parameter types
+        parameter_types (tuple of JavaType): Declared parameter types
         return_type (JavaType): Method’s declared return type
     """
-    def __init__(self, name, parameter_types=[], return_type=None):
-        self.name = name
-        self.parameter_types = parameter_types
+    __slots__ = ('name', 'parameter_types', 'return_type')
+
+    def __init__(self, name, parameter_types=None, return_type=None):
+        self.name = sys.intern(name)
+        self.parameter_types = tuple(parameter_types) if parameter_types else ()
         self.return_type = return_type
 
 
@@ -97,11 +117,28 @@ class JavaPrimitiveType(JavaType):
 
     Primitive types are not object types and do not have methods.
     """
+    __slots__ = ()
+
     def is_subtype_of(self, other):
         # Check if 'other' is the same instance as 'self'
         return self is other
 
 
+# Everything a pickled JavaObjectType keeps: all of its slots except the derived method table and
+# the weak links to its subtypes, which __setstate__ rebuilds.
+_PICKLED_OBJECT_TYPE_SLOTS = (
+    'name', 'direct_supertypes', 'constructor', 'methods',
+    '_mro', '_all_supertypes', '_all_supertype_names', '_methods_version',
+)
+
+# The supertypes of an object type that declares none. Empty while Object itself is being built,
+# then set to (Object,) right after JavaBuiltInTypes creates it.
+_implicit_supertypes = ()
+
+# Names of every object type built so far, for JavaNullType.is_subtype_of_name()
+_object_type_names = set()
+
+
 class JavaObjectType(JavaType):
     """
     Describes the API of a Java type whose values are objects, i.e. a class or interface.
@@ -113,46 +150,119 @@ class JavaObjectType(JavaType):
 
     Attributes:
         name (str): The name of this class
-        direct_supertypes (list of JavaObjectType): types this class extends or implements
+        direct_supertypes (tuple of JavaObjectType): types this class extends or implements
         constructor (JavaConstructor): Class’s constructor (we only allow one)
-        methods (list of JavaMethod): Class's methods
+        methods (dict of str to JavaMethod): Class's own methods, by name
     """
+    __slots__ = (
+        'direct_supertypes', 'constructor', 'methods',
+        '_mro', '_all_supertypes', '_all_supertype_names',
+        '_all_methods', '_methods_version', '_direct_subtypes', '__weakref__',
+    )
 
     is_object_type = True
     is_instantiable = True
 
-    def __init__(self, name, direct_supertypes=None, constructor=JavaConstructor([])):
+    # Bumped whenever any type gains a method. Caches that depend on many types at once use it to
+    # tell when some method lookup may have changed.
+    _method_generation = 0
+
+    def __init__(self, name, direct_supertypes=None, constructor=None):
         super().__init__(name)
-        self.name = name
+        _object_type_names.add(self.name)
         if direct_supertypes is None:
-            self.direct_supertypes = [JavaBuiltInTypes.OBJECT]
+            self.direct_supertypes = (JavaBuiltInTypes.OBJECT,)
         else:
-            self.direct_supertypes = direct_supertypes
-        self.constructor = constructor
+            self.direct_supertypes = tuple(direct_supertypes)
+        self.constructor = constructor if constructor is not None else JavaConstructor()
         self.methods = {}
+        self._all_methods = None            # built on demand by _flattened_methods()
+        self._methods_version = 0           # bumped when this type or a supertype gains a method
+        self._direct_subtypes = weakref.WeakSet()
+
+        # Supertypes are fixed at construction, so we can linearize the hierarchy once: _mro lists
+        # this type and all of its transitive supertypes, each exactly once, in the order method
+        # lookup should search them (depth-first, leftmost supertype first). Every class implicitly
+        # extends Object, even when its declared supertypes omit it.
+        mro = [self]
+        seen = {self}
+        for supertype in self.direct_supertypes or _implicit_supertypes:
+            supertype._direct_subtypes.add(self)
+            for ancestor in supertype._mro:
+                if ancestor not in seen:
+                    seen.add(ancestor)
+                    mro.append(ancestor)
+        self._mro = tuple(mro)
+        self._all_supertypes = frozenset(seen)
+        # Plain strings, unlike the types themselves, are hashable across processes and cheap to
+        # pickle, so name-only queries can be answered without the object graph.
+        self._all_supertype_names = frozenset(ancestor.name for ancestor in seen)
+
+    def __getstate__(self):
+        # The weak subtype links cannot be pickled, and the method table is cheap to rebuild
+        return {slot: getattr(self, slot) for slot in _PICKLED_OBJECT_TYPE_SLOTS}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        _object_type_names.add(self.name)
+        self._all_methods = None
+        if not hasattr(self, "_direct_subtypes"):  # may exist already; see _add_direct_subtype()
+            self._direct_subtypes = weakref.WeakSet()
+        # _mro[1:2] is the implicit Object of a type that declares no supertypes
+        for supertype in self.direct_supertypes or self._mro[1:2]:
+            supertype._add_direct_subtype(self)
+
+    def _add_direct_subtype(self, subtype):
+        # While unpickling a cyclic hierarchy, a subtype can be restored before its supertype
+        if not hasattr(self, "_direct_subtypes"):
+            self._direct_subtypes = weakref.WeakSet()
+        self._direct_subtypes.add(subtype)
 
     def add_method(self, method):
         self.methods[method.name] = method
+        JavaObjectType._method_generation += 1
+
+        # Only this type and the types that inherit from it need to rebuild their method tables
+        stale = [self]
+        seen = {self}
+        while stale:
+            java_type = stale.pop()
+            java_type._all_methods = None
+            java_type._methods_version += 1
+            for subtype in java_type._direct_subtypes:
+                if subtype not in seen:
+                    seen.add(subtype)
+                    stale.append(subtype)
 
     def method_named(self, name):
-        try:
-            return self.methods[name]
-        except KeyError:
-            for supertype in self.direct_supertypes:
-                try:
-                    return supertype.method_named(name)
-                except NoSuchJavaMethod:
-                    pass
+        method = self._flattened_methods().get(name)
+        if method is None:
             raise NoSuchJavaMethod("{0} has no method named {1}".format(self.name, name))
+        return method
+
+    def _flattened_methods(self):
+        """Returns a dict of every method this type declares or inherits, by name.
+
+        Methods from types earlier in the MRO win, so a type's own methods override inherited ones.
+        The dict is built on first use, and rebuilt only after this type or one of its supertypes
+        gains a method.
+        """
+        if self._all_methods is None:
+            all_methods = {}
+            for java_type in reversed(self._mro):
+                all_methods.update(java_type.methods)
+            self._all_methods = all_methods
+        return self._all_methods
 
     def is_subtype_of(self, other):
-        if self is other:
-            return True
-        # check all direct and indirect supertypes
-        for supertype in self.direct_supertypes:
-            if supertype.is_subtype_of(other):
-                return True
-        return False
+        # _all_supertypes includes this type itself and Object, so no special cases are needed.
+        # A set beats scanning the _mro tuple even for tiny hierarchies: types hash by identity,
+        # which is cheaper than a tuple scan's per-element comparisons.
+        return other in self._all_supertypes
+
+    def is_subtype_of_name(self, name):
+        return name in self._all_supertype_names
     
 
 class JavaVoidType(JavaType):
@@ -161,6 +271,8 @@ class JavaVoidType(JavaType):
     It is never legal to use the result of a method returning void inside a larger expression.
     Void is therefore subtype only of itself, and not any other type.
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("void")
 
@@ -172,6 +284,8 @@ class JavaNullType(JavaType):
     Null acts as though it is a subtype of all object types. However, it raises an exception for any
     attempt to look up a method.
     """
+    __slots__ = ()
+
     is_object_type = True
     is_instantiable = False
 
@@ -180,18 +294,16 @@ class JavaNullType(JavaType):
 
     def is_subtype_of(self, other):
         # null is considered a subtype of any object type, but not of primitive types
-        return isinstance(other, JavaObjectType) or other is self
+        return other is self or isinstance(other, JavaObjectType)
     
+    def is_subtype_of_name(self, name):
+        # Like is_subtype_of(): null fits any object type, but not the primitive types or void
+        return name == self.name or name in _object_type_names
+
     def method_named(self, method_name):
     # When trying to call a method on null, raise NoSuchJavaMethod with the specific message
          raise NoSuchJavaMethod(f"Cannot invoke method {method_name}() on null")
 
-    
-class JavaTypeError(Exception):
-    """Indicates a compile-time type error in an expression.
-    """
-    pass
-
 
 class JavaBuiltInTypes:
     """The types that are built into the Java language itself.
@@ -212,3 +324,7 @@ class JavaBuiltInTypes:
     )
     OBJECT.add_method(JavaMethod("equals", parameter_types=[OBJECT], return_type=BOOLEAN))
     OBJECT.add_method(JavaMethod("hashCode", return_type=INT))
+
+
+# Object now exists, so every object type built from here on implicitly extends it
+_implicit_supertypes = (JavaBuiltInTypes.OBJECT,)
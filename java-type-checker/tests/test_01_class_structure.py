@@ -2,6 +2,7 @@
 
 from java_type_checker import *
 from tests.fixtures import Graphics
+import pickle
 import unittest
 
 
@@ -23,6 +24,44 @@ class TestClassStructure(unittest.TestCase):
         with self.assertRaisesRegex(NoSuchJavaMethod, "ergleflopse"):
             Graphics.point.method_named("ergleflopse")
 
+    def test_04_finds_method_added_to_supertype_after_lookup(self):
+        shape = JavaObjectType("Shape")
+        circle = JavaObjectType("Circle", direct_supertypes=[shape])
+        with self.assertRaises(NoSuchJavaMethod):
+            circle.method_named("getRadius")
+        shape.add_method(JavaMethod("getRadius", return_type=JavaBuiltInTypes.DOUBLE))
+        self.assertEqual("getRadius", circle.method_named("getRadius").name)
+
+    def test_04a_repeated_failed_lookups_still_see_new_methods(self):
+        shape = JavaObjectType("Shape")
+        circle = JavaObjectType("Circle", direct_supertypes=[shape])
+        for i in range(3):
+            with self.assertRaises(NoSuchJavaMethod):
+                circle.method_named("getArea")
+        circle.add_method(JavaMethod("getArea", return_type=JavaBuiltInTypes.DOUBLE))
+        self.assertEqual("getArea", circle.method_named("getArea").name)
+
+    def test_04b_adding_method_keeps_unrelated_method_tables(self):
+        self.assertEqual("getX", Graphics.point.method_named("getX").name)
+        point_methods = Graphics.point._flattened_methods()
+        JavaObjectType("Unrelated").add_method(JavaMethod("getZ"))
+        self.assertIs(point_methods, Graphics.point._flattened_methods())
+
+    def test_04c_types_survive_pickling(self):
+        rectangle = pickle.loads(pickle.dumps(Graphics.rectangle))
+        self.assertEqual("Rectangle", rectangle.name)
+        self.assertEqual("getSize", rectangle.method_named("getSize").name)
+        self.assertEqual("hashCode", rectangle.method_named("hashCode").name)
+
+        graphics_object = rectangle.direct_supertypes[0]
+        self.assertTrue(rectangle.is_subtype_of(graphics_object))
+        graphics_object.add_method(JavaMethod("getZ", return_type=JavaBuiltInTypes.DOUBLE))
+        self.assertEqual("getZ", rectangle.method_named("getZ").name)
+
+    def test_05_no_such_method_is_a_type_error(self):
+        with self.assertRaises(JavaTypeError):
+            Graphics.point.method_named("ergleflopse")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -62,6 +62,20 @@ class TestObjectTypeRelationships(TypeTest):
                 direct_supertypes=[unrelated_type, deep_subtype])
         self.assertSubtype(deep_subtype, Graphics.strokable)
 
+    def test_03a_subtype_handles_repeated_diamonds(self):
+        """If U and V both extend T, and W extends both U and V, then T is reachable from W along
+        two paths. Stacking many such diamonds must not make subtype checks explode.
+        """
+        diamond_bottom = Graphics.rectangle
+        for i in range(100):
+            left = JavaObjectType("Left{0}".format(i), direct_supertypes=[diamond_bottom])
+            right = JavaObjectType("Right{0}".format(i), direct_supertypes=[diamond_bottom])
+            diamond_bottom = JavaObjectType(
+                "Diamond{0}".format(i),
+                direct_supertypes=[left, right])
+        self.assertSubtype(diamond_bottom, Graphics.fillable)
+        self.assertNotSubtype(diamond_bottom, Graphics.point)
+
     def test_04_subtype_does_not_include_unrelated_types(self):
         """If there is no chain of extends/implements relationships between T and U, then neither
         one is a subtype of the other.
@@ -72,6 +86,37 @@ class TestObjectTypeRelationships(TypeTest):
     def test_05_object_types_are_never_subtypes_of_primitive_types(self):
         self.assertNotSubtype(Graphics.rectangle, JavaBuiltInTypes.DOUBLE)
 
+    def test_06_object_types_are_always_subtypes_of_object(self):
+        """Every Java class implicitly extends Object, even if its declared supertypes omit it.
+        """
+        rootless = JavaObjectType("Rootless", direct_supertypes=[])
+        self.assertSubtype(rootless, JavaBuiltInTypes.OBJECT)
+        self.assertTrue(rootless.is_subtype_of_name("Object"))
+        self.assertEqual("hashCode", rootless.method_named("hashCode").name)
+
+    def test_07_subtype_check_by_name(self):
+        self.assertTrue(Graphics.rectangle.is_subtype_of_name("Rectangle"))
+        self.assertTrue(Graphics.rectangle.is_subtype_of_name("Fillable"))
+        self.assertTrue(Graphics.rectangle.is_subtype_of_name("Object"))
+        self.assertFalse(Graphics.rectangle.is_subtype_of_name("Point"))
+        self.assertFalse(Graphics.graphics_object.is_subtype_of_name("Rectangle"))
+
+        self.assertTrue(JavaBuiltInTypes.INT.is_subtype_of_name("int"))
+        self.assertFalse(JavaBuiltInTypes.INT.is_subtype_of_name("double"))
+        self.assertFalse(JavaBuiltInTypes.INT.is_subtype_of_name("Object"))
+
+        self.assertTrue(JavaBuiltInTypes.NULL.is_subtype_of_name("null"))
+        self.assertTrue(JavaBuiltInTypes.NULL.is_subtype_of_name("Object"))
+        self.assertTrue(JavaBuiltInTypes.NULL.is_subtype_of_name("Rectangle"))
+        self.assertFalse(JavaBuiltInTypes.NULL.is_subtype_of_name("int"))
+        self.assertFalse(JavaBuiltInTypes.NULL.is_subtype_of_name("void"))
+
+    def test_07a_null_subtype_check_by_name_agrees_with_type_check(self):
+        long_type = JavaPrimitiveType("long")
+        self.assertFalse(JavaBuiltInTypes.NULL.is_subtype_of(long_type))
+        self.assertFalse(JavaBuiltInTypes.NULL.is_subtype_of_name("long"))
+        self.assertFalse(JavaBuiltInTypes.NULL.is_subtype_of_name("NoSuchType"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -54,6 +54,16 @@ class TestExpressionStaticTypes(TypeTest):
             JavaBuiltInTypes.DOUBLE,
             JavaMethodCall(JavaVariable("p", Graphics.point), "getX").static_type())
 
+    def test_04_method_call_static_type_follows_later_overrides(self):
+        shape = JavaObjectType("Shape")
+        shape.add_method(JavaMethod("area", return_type=JavaBuiltInTypes.DOUBLE))
+        circle = JavaObjectType("Circle", direct_supertypes=[shape])
+        call = JavaMethodCall(JavaVariable("c", circle), "area")
+        self.assertEqual(JavaBuiltInTypes.DOUBLE, call.static_type())
+
+        circle.add_method(JavaMethod("area", return_type=JavaBuiltInTypes.INT))
+        self.assertEqual(JavaBuiltInTypes.INT, call.static_type())
+
 
 if __name__ == '__main__':
     unittest.main()
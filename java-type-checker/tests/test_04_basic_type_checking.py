@@ -23,6 +23,79 @@ class TestBasicTypeChecking(TypeTest):
         self.assertNoCompileErrors(
             JavaLiteral("3.72", JavaBuiltInTypes.DOUBLE))
 
+    def test_02_checker_can_be_reused_across_expressions(self):
+        checker = JavaTypeChecker()
+        checker.check(JavaVariable("p", Graphics.point))
+        checker.check(JavaNullLiteral())
+        with self.assertRaises(JavaTypeMismatchError):
+            checker.check(
+                JavaAssignment(
+                    JavaVariable("x", JavaBuiltInTypes.INT),
+                    JavaLiteral("true", JavaBuiltInTypes.BOOLEAN)))
+        checker.check(JavaMethodCall(JavaVariable("p", Graphics.point), "getX"))
+
+    def test_02a_checker_subclass_can_override_a_rule(self):
+        class NoMethodCallsChecker(JavaTypeChecker):
+            def _check_method_call(self, expr):
+                raise JavaTypeError("Method calls are not allowed here")
+
+        call = JavaMethodCall(JavaVariable("p", Graphics.point), "getX")
+        with self.assertRaisesRegex(JavaTypeError, "not allowed"):
+            NoMethodCallsChecker().check(call)
+        with self.assertRaisesRegex(JavaTypeError, "not allowed"):
+            NoMethodCallsChecker().check(
+                JavaAssignment(JavaVariable("x", JavaBuiltInTypes.DOUBLE), call))
+
+    def test_02b_node_checked_by_one_checker_is_still_checked_by_another(self):
+        class NoMethodCallsChecker(JavaTypeChecker):
+            def _check_method_call(self, expr):
+                raise JavaTypeError("Method calls are not allowed here")
+
+        call = JavaMethodCall(JavaVariable("p", Graphics.point), "getX")
+        self.assertNoCompileErrors(call)
+        with self.assertRaisesRegex(JavaTypeError, "not allowed"):
+            NoMethodCallsChecker().check(call)
+
+    def test_02c_passed_node_is_rechecked_after_types_change(self):
+        shape = JavaObjectType("Shape")
+        shape.add_method(JavaMethod("area", return_type=JavaBuiltInTypes.DOUBLE))
+        circle = JavaObjectType("Circle", direct_supertypes=[shape])
+        assignment = JavaAssignment(
+            JavaVariable("a", JavaBuiltInTypes.DOUBLE),
+            JavaMethodCall(JavaVariable("c", circle), "area"))
+        self.assertNoCompileErrors(assignment)
+
+        circle.add_method(JavaMethod("area", return_type=JavaBuiltInTypes.INT))
+        with self.assertRaises(JavaTypeMismatchError):
+            assignment.check_types()
+
+    def test_02d_nested_node_with_its_own_check_types_is_checked_by_it(self):
+        class UncheckedConstructorCall(JavaConstructorCall):
+            def static_type(self):
+                return self.instantiated_type
+
+            def check_types(self):
+                pass
+
+        self.assertNoCompileErrors(
+            JavaAssignment(
+                JavaVariable("p", Graphics.point),
+                UncheckedConstructorCall(Graphics.point)))
+
+    def test_03_repeated_checks_report_the_same_result(self):
+        bad_assignment = JavaAssignment(
+            JavaVariable("x", JavaBuiltInTypes.INT),
+            JavaLiteral("true", JavaBuiltInTypes.BOOLEAN))
+        for i in range(2):
+            with self.assertRaises(JavaTypeMismatchError):
+                bad_assignment.check_types()
+
+        good_assignment = JavaAssignment(
+            JavaVariable("x", JavaBuiltInTypes.INT),
+            JavaLiteral("3", JavaBuiltInTypes.INT))
+        for i in range(2):
+            self.assertNoCompileErrors(good_assignment)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -36,6 +36,14 @@ class TestAssignmentTypeChecking(TypeTest):
                 JavaVariable("r", Graphics.rectangle),
                 JavaVariable("f", Graphics.fillable)))
 
+    def test_04_non_variable_target_is_described_by_its_type(self):
+        self.assertCompileError(
+            JavaTypeMismatchError,
+            "Cannot assign boolean to double",
+            JavaAssignment(
+                JavaMethodCall(JavaVariable("p", Graphics.point), "getX"),
+                JavaLiteral("true", JavaBuiltInTypes.BOOLEAN)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -121,6 +121,42 @@ class TestMethodTypeChecking(TypeTest):
                 JavaVariable("x", JavaBuiltInTypes.INT),
                 "hashCode"))
 
+    def test_08_mismatch_error_carries_argument_types(self):
+        with self.assertRaises(JavaTypeMismatchError) as exception_context:
+            JavaMethodCall(
+                JavaVariable("rect", Graphics.rectangle),
+                "setPosition",
+                JavaLiteral("0.0", JavaBuiltInTypes.DOUBLE),
+                JavaLiteral("true", JavaBuiltInTypes.BOOLEAN)).check_types()
+        error = exception_context.exception
+        self.assertEqual(Graphics.rectangle, error.callee_type)
+        self.assertEqual("setPosition", error.callee_name)
+        self.assertEqual(
+            [JavaBuiltInTypes.DOUBLE, JavaBuiltInTypes.DOUBLE], list(error.expected_types))
+        self.assertEqual(
+            [JavaBuiltInTypes.DOUBLE, JavaBuiltInTypes.BOOLEAN], list(error.actual_types))
+        self.assertEqual(
+            [(1, JavaBuiltInTypes.BOOLEAN, JavaBuiltInTypes.DOUBLE)], error.mismatches)
+        self.assertEqual(
+            "JavaTypeMismatchError('Rectangle.setPosition() expects arguments of type "
+            "(double, double), but got (double, boolean)')",
+            repr(error))
+
+    def test_08a_errors_without_details_have_empty_messages(self):
+        for error_class in (JavaTypeMismatchError, JavaArgumentCountError):
+            self.assertEqual("", str(error_class()))
+
+    def test_09_mismatch_error_reports_every_bad_argument(self):
+        with self.assertRaises(JavaTypeMismatchError) as exception_context:
+            JavaMethodCall(
+                JavaVariable("rect", Graphics.rectangle),
+                "setPosition",
+                JavaLiteral("true", JavaBuiltInTypes.BOOLEAN),
+                JavaLiteral("0", JavaBuiltInTypes.INT)).check_types()
+        self.assertEqual(
+            [0, 1],
+            [index for index, _, _ in exception_context.exception.mismatches])
+
 
 if __name__ == '__main__':
     unittest.main()